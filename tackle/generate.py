@@ -4,12 +4,13 @@ import logging
 import os
 import shutil
 import re
+import stat
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 
-from binaryornot.check import is_binary
-from jinja2 import FileSystemLoader
 from jinja2.exceptions import TemplateSyntaxError, UndefinedError
 
-from tackle.render.environment import StrictEnvironment
+from tackle.render.environment import compile_template, get_env
 from tackle.exceptions import (
     FailedHookException,
     NonTemplatedInputDirException,
@@ -17,7 +18,13 @@ from tackle.exceptions import (
     UndefinedVariableInTemplate,
 )
 from tackle.hooks import run_hook
-from tackle.utils.paths import rmtree, make_sure_path_exists
+from tackle.utils.binary import CHUNK_SIZE, is_binary_chunk
+from tackle.utils.paths import (
+    fast_copy2,
+    fast_copyfile,
+    make_sure_path_exists,
+    rmtree,
+)
 from tackle.utils.context_manager import work_in
 from tackle.render import build_render_context
 
@@ -29,31 +36,74 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 TEMPLATE_DIR_REGEX = r".*\{\{+[\s]?[a-zA-Z0-9_.-]+[\s]?\}\}"
+NEWLINE_REGEX = re.compile(r'\r\n|\r|\n')
 
 
-def is_copy_only_path(path, context: 'Context'):
-    """Check whether the given `path` should only be copied and not rendered.
+@lru_cache(maxsize=32)
+def _template_markers(env):
+    """Compile a regex matching the start of any Jinja syntax for `env`.
+
+    Delimiters come from the environment as `_jinja2_env_vars` can change them.
+    """
+    markers = [
+        env.variable_start_string,
+        env.block_start_string,
+        env.comment_start_string,
+        env.line_statement_prefix,
+        env.line_comment_prefix,
+    ]
+    return re.compile('|'.join(re.escape(m) for m in markers if m))
 
-    Returns True if `path` matches a pattern in the given `context` dict,
-    otherwise False.
 
-    :param path: A file-system path referring to a file or dir that
-        should be rendered or just copied.
+def _render_path(env, path, render_context):
+    """Render a file or dir path, skipping Jinja when it has nothing to render."""
+    if not _template_markers(env).search(path):
+        return path
+    return compile_template(env, path).render(**render_context)
+
+
+def _detect_newline(source):
+    """Return the first line ending in `source` or None if there are none."""
+    match = NEWLINE_REGEX.search(source)
+    return match.group() if match else None
+
+
+def _render_context(context: 'Context', output: 'Output'):
+    """Return the render context built once for the run or build it now."""
+    if output.render_context is None:
+        return build_render_context(context)
+    return output.render_context
+
+
+def _compile_copy_patterns(context: 'Context'):
+    """Translate the `_copy_without_render` globs into compiled regexes once.
+
     :param context: cookiecutter context.
+    :returns: List of compiled patterns, empty if the key is not set.
     """
     try:
-        for dont_render in context.input_dict[context.context_key][
-            '_copy_without_render'
-        ]:
-            if fnmatch.fnmatch(path, dont_render):
-                return True
+        patterns = context.input_dict[context.context_key]['_copy_without_render']
     except KeyError:
-        return False
+        return []
+
+    return [re.compile(fnmatch.translate(os.path.normcase(p))) for p in patterns]
+
 
-    return False
+def is_copy_only_path(path, copy_patterns):
+    """Check whether the given `path` should only be copied and not rendered.
 
+    Returns True if `path` matches one of the compiled `_copy_without_render`
+    patterns, otherwise False.
 
-def generate_file(project_dir, context: 'Context', output: 'Output'):
+    :param path: A file-system path referring to a file or dir that
+        should be rendered or just copied.
+    :param copy_patterns: Patterns from `_compile_copy_patterns`.
+    """
+    path = os.path.normcase(path)
+    return any(p.match(path) for p in copy_patterns)
+
+
+def generate_file(project_dir, context: 'Context', output: 'Output', infile=None):
     """Render filename of infile as name of outfile, handle infile correctly.
 
     Dealing with infile appropriately:
@@ -69,21 +119,21 @@ def generate_file(project_dir, context: 'Context', output: 'Output'):
         way to perform this directory change.
 
     :param project_dir: Absolute path to the resulting generated project.
-    :param infile: Input file to generate the file from. Relative to the root
-        template dir.
     :param context: Dict for populating the cookiecutter's variables.
     :param env: Jinja2 template execution environment.
+    :param infile: Input file to generate the file from. Relative to the root
+        template dir. Defaults to `output.infile`, passing it lets files be
+        rendered concurrently against the same output.
     """
-    logger.debug('Processing file %s', output.infile)
+    if infile is None:
+        infile = output.infile
+    logger.debug('Processing file %s', infile)
 
     # Render the path to the output file (not including the root project dir)
-    outfile_tmpl = output.env.from_string(output.infile)
-
-    from tackle.render import build_render_context
-
-    render_context = build_render_context(context)
-
-    outfile = os.path.join(project_dir, outfile_tmpl.render(**render_context))
+    render_context = _render_context(context, output)
+    outfile = os.path.join(
+        project_dir, _render_path(output.env, infile, render_context)
+    )
     file_name_is_empty = os.path.isdir(outfile)
     if file_name_is_empty:
         logger.debug('The resulting file name is empty: %s', outfile)
@@ -95,21 +145,35 @@ def generate_file(project_dir, context: 'Context', output: 'Output'):
 
     logger.debug('Created file at %s', outfile)
 
+    # Read the file once, the head tells if it is binary and for text files it
+    # is the start of the template source
+    logger.debug("Check %s to see if it's a binary", infile)
+    with open(infile, 'rb') as f:
+        # Mode of the already open file, applied to the output at the end
+        mode = stat.S_IMODE(os.fstat(f.fileno()).st_mode)
+        chunk = f.read(CHUNK_SIZE)
+        binary = is_binary_chunk(chunk)
+        if not binary:
+            source = (chunk + f.read()).decode('utf-8')
+
     # Just copy over binary files. Don't render.
-    logger.debug("Check %s to see if it's a binary", output.infile)
-    if is_binary(output.infile):
-        logger.debug(
-            'Copying binary %s to %s without rendering', output.infile, outfile
-        )
-        shutil.copyfile(output.infile, outfile)
+    if binary:
+        logger.debug('Copying binary %s to %s without rendering', infile, outfile)
+        fast_copyfile(infile, outfile)
     else:
-        # Force fwd slashes on Windows for get_template
+        # Force fwd slashes on Windows for the template name
         # This is a by-design Jinja issue
-        infile_fwd_slashes = output.infile.replace(os.path.sep, '/')
+        infile_fwd_slashes = infile.replace(os.path.sep, '/')
 
         # Render the file
         try:
-            tmpl = output.env.get_template(infile_fwd_slashes)
+            # Named like the loader's templates so errors point at the file
+            code = output.env.compile(
+                source, infile_fwd_slashes, os.path.join(os.curdir, infile)
+            )
+            tmpl = output.env.template_class.from_code(
+                output.env, code, output.env.make_globals(None)
+            )
         except TemplateSyntaxError as exception:
             # Disable translated so that printed exception contains verbose
             # information about syntax error location
@@ -118,15 +182,12 @@ def generate_file(project_dir, context: 'Context', output: 'Output'):
         rendered_file = tmpl.render(**render_context)
 
         # Detect original file newline to output the rendered file
-        # note: newline='' ensures newlines are not converted
-        with open(output.infile, 'r', encoding='utf-8', newline='') as rd:
-            rd.readline()  # Read the first line to load 'newlines' value
+        newline = _detect_newline(source)
 
-            # Use `_new_lines` overwrite from context, if configured.
-            newline = rd.newlines
-            if context.input_dict[context.context_key].get('_new_lines', False):
-                newline = context.input_dict[context.context_key]['_new_lines']
-                logger.debug('Overwriting end line character with %s', newline)
+        # Use `_new_lines` overwrite from context, if configured.
+        if context.input_dict[context.context_key].get('_new_lines', False):
+            newline = context.input_dict[context.context_key]['_new_lines']
+            logger.debug('Overwriting end line character with %s', newline)
 
         logger.debug('Writing contents to file %s', outfile)
 
@@ -134,14 +195,13 @@ def generate_file(project_dir, context: 'Context', output: 'Output'):
             fh.write(rendered_file)
 
     # Apply file permissions to output file
-    shutil.copymode(output.infile, outfile)
+    os.chmod(outfile, mode)
 
 
 def render_and_create_dir(dirname, context: 'Context', output: 'Output'):
     """Render name of a directory, create the directory, return its path."""
-    name_tmpl = output.env.from_string(dirname)
-    render_context = build_render_context(context)
-    rendered_dirname = name_tmpl.render(render_context)
+    render_context = _render_context(context, output)
+    rendered_dirname = _render_path(output.env, dirname, render_context)
 
     dir_to_create = os.path.normpath(os.path.join(output.output_dir, rendered_dirname))
 
@@ -202,6 +262,15 @@ def _run_hook_from_repo_dir(
             raise
 
 
+def _run_post_gen_hooks(context: 'Context'):
+    """Run the hooks that were deferred with `post_gen_hook`.
+
+    Goes through `call` like every other hook so `chdir` is respected.
+    """
+    for hook in context.post_gen_hooks:
+        hook.call()
+
+
 def find_template(repo_dir):
     """Determine which child directory of `repo_dir` is the project template.
 
@@ -226,6 +295,37 @@ def find_template(repo_dir):
         return None
 
 
+def _walk(top, root=''):
+    """Walk a directory tree top down like `os.walk` but yield `os.DirEntry`s.
+
+    Entries carry the file type from the directory listing so classifying them
+    does not need an extra stat per entry. As with `os.walk`, the caller can
+    prune the yielded dirs list in place to skip those subtrees and symlinked
+    dirs are listed but not followed.
+
+    :param top: Directory to start walking from.
+    :param root: Path of `top` relative to where the walk started, which is
+        what gets yielded so callers can join entry names onto it directly.
+    """
+    dirs = []
+    files = []
+    try:
+        with os.scandir(top) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.append(entry)
+                else:
+                    files.append(entry)
+    except OSError:
+        return
+
+    yield root, dirs, files
+
+    for d in dirs:
+        if not d.is_symlink():
+            yield from _walk(d.path, os.path.join(root, d.name))
+
+
 def generate_files(output: 'Output', context: 'Context', source: 'Source'):
     """Render the templates and saves them to files.
 
@@ -244,9 +344,16 @@ def generate_files(output: 'Output', context: 'Context', source: 'Source'):
 
         unrendered_dir = os.path.split(template_dir)[1]
         ensure_dir_is_templated(unrendered_dir)
-        output.env = StrictEnvironment(
-            context=context.input_dict, keep_trailing_newline=True, **envvars
+        copy_patterns = _compile_copy_patterns(context)
+        output.env = get_env(
+            context=context.input_dict,
+            template_dir=os.path.abspath(template_dir),
+            keep_trailing_newline=True,
+            **envvars,
         )
+        # The context does not change while generating so only build the render
+        # context once here and once more below as it includes the `cwd`
+        output.render_context = build_render_context(context)
         try:
             project_dir, output_directory_created = render_and_create_dir(
                 unrendered_dir, context, output
@@ -255,9 +362,8 @@ def generate_files(output: 'Output', context: 'Context', source: 'Source'):
             msg = "Unable to create project directory '{}'".format(unrendered_dir)
             raise UndefinedVariableInTemplate(msg, err, context.input_dict)
 
-        # We want the Jinja path and the OS paths to match. Consequently, we'll:
-        #   + CD to the template folder
-        #   + Set Jinja's path to '.'
+        # We want the Jinja path and the OS paths to match. Consequently, we'll
+        # CD to the template folder which is also where Jinja's loader points.
         #
         #  In order to build our files to the correct folder(s), we'll use an
         # absolute path for the target folder (project_dir)
@@ -277,40 +383,49 @@ def generate_files(output: 'Output', context: 'Context', source: 'Source'):
                 context,
             )
 
-        with work_in(template_dir):
-            output.env.loader = FileSystemLoader('.')
-
-            for root, dirs, files in os.walk('.'):
+        def render_file(infile):
+            if is_copy_only_path(infile, copy_patterns):
+                outfile_rendered = _render_path(output.env, infile, context.input_dict)
+                outfile = os.path.join(project_dir, outfile_rendered)
+                logger.debug('Copying file %s to %s without rendering', infile, outfile)
+                fast_copyfile(infile, outfile)
+                shutil.copymode(infile, outfile)
+            else:
+                generate_file(project_dir, context, output, infile=infile)
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with work_in(template_dir), ThreadPoolExecutor(max_workers) as pool:
+            output.render_context = build_render_context(context)
+            for root, dirs, files in _walk('.'):
                 # We must separate the two types of dirs into different lists.
-                # The reason is that we don't want ``os.walk`` to go through the
+                # The reason is that we don't want ``_walk`` to go through the
                 # unrendered directories, since they will just be copied.
                 copy_dirs = []
                 render_dirs = []
 
                 for d in dirs:
-                    d_ = os.path.normpath(os.path.join(root, d))
+                    indir = os.path.join(root, d.name)
                     # We check the full path, because that's how it can be
                     # specified in the ``_copy_without_render`` setting, but
-                    # we store just the dir name
-                    if is_copy_only_path(d_, context):
-                        copy_dirs.append(d)
+                    # we keep the entry for the dirs to walk into
+                    if is_copy_only_path(indir, copy_patterns):
+                        copy_dirs.append(indir)
                     else:
                         render_dirs.append(d)
 
-                for copy_dir in copy_dirs:
-                    indir = os.path.normpath(os.path.join(root, copy_dir))
-                    outdir = os.path.normpath(os.path.join(project_dir, indir))
-                    outdir = output.env.from_string(outdir).render(**context.input_dict)
+                for indir in copy_dirs:
+                    outdir = os.path.join(project_dir, indir)
+                    outdir = _render_path(output.env, outdir, context.input_dict)
                     logger.debug(
                         'Copying dir %s to %s without rendering', indir, outdir
                     )
-                    shutil.copytree(indir, outdir)
+                    shutil.copytree(indir, outdir, copy_function=fast_copy2)
 
                 # We mutate ``dirs``, because we only want to go through these dirs
                 # recursively
                 dirs[:] = render_dirs
                 for d in dirs:
-                    unrendered_dir = os.path.join(project_dir, root, d)
+                    unrendered_dir = os.path.join(project_dir, root, d.name)
                     try:
                         render_and_create_dir(unrendered_dir, context, output)
                     except UndefinedError as err:
@@ -320,27 +435,22 @@ def generate_files(output: 'Output', context: 'Context', source: 'Source'):
                         msg = "Unable to create directory '{}'".format(_dir)
                         raise UndefinedVariableInTemplate(msg, err, context.input_dict)
 
-                for f in files:
-                    output.infile = os.path.normpath(os.path.join(root, f))
-                    if is_copy_only_path(output.infile, context):
-                        outfile_tmpl = output.env.from_string(output.infile)
-                        outfile_rendered = outfile_tmpl.render(**context.input_dict)
-                        outfile = os.path.join(project_dir, outfile_rendered)
-                        logger.debug(
-                            'Copying file %s to %s without rendering',
-                            output.infile,
-                            outfile,
-                        )
-                        shutil.copyfile(output.infile, outfile)
-                        shutil.copymode(output.infile, outfile)
-                        continue
+                # Files within a directory are independent of each other so
+                # their rendering and I/O is overlapped in the pool. All of them
+                # finish before any error is raised so a failed project can be
+                # removed without writes still in flight.
+                futures = {
+                    infile: pool.submit(render_file, infile)
+                    for infile in (os.path.join(root, f.name) for f in files)
+                }
+                wait(futures.values())
+                for infile, future in futures.items():
                     try:
-                        generate_file(project_dir, context, output)
-
+                        future.result()
                     except UndefinedError as err:
                         if delete_project_on_failure:
                             rmtree(project_dir)
-                        msg = "Unable to create file '{}'".format(output.infile)
+                        msg = "Unable to create file '{}'".format(infile)
                         raise UndefinedVariableInTemplate(msg, err, context.input_dict)
 
         if output.accept_hooks:
@@ -352,8 +462,7 @@ def generate_files(output: 'Output', context: 'Context', source: 'Source'):
                 context,
             )
 
-            for hook in context.post_gen_hooks:
-                hook.execute()
+            _run_post_gen_hooks(context)
 
             logger.debug('Resulting project directory created at %s', project_dir)
             return project_dir
@@ -367,8 +476,7 @@ def generate_files(output: 'Output', context: 'Context', source: 'Source'):
                 context,
             )
 
-        for hook in context.post_gen_hooks:
-            hook.execute()
+        _run_post_gen_hooks(context)
 
         logger.debug('No project directory was created')
         return None
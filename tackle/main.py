@@ -5,8 +5,6 @@ The code in this module is also a good example of how to use Tackle as a
 library rather than a script.
 """
 import logging
-import json
-from _collections import OrderedDict
 
 from tackle.generate import generate_files
 from tackle.utils.paths import rmtree
@@ -120,7 +118,4 @@ def tackle(
     if source.cleanup:
         rmtree(source.repo_dir)
 
-    if isinstance(context, OrderedDict):
-        context = json.loads(json.dumps(context))
-
     return context.output_dict
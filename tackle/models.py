@@ -170,3 +170,4 @@ class Output(BaseModel):
     unrendered_dir: str = None
     env: Type[StrictEnvironment] = None
     infile: str = None
+    render_context: dict = None
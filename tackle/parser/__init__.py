@@ -5,9 +5,12 @@ import os
 import yaml
 import logging
 from collections import OrderedDict
+from copy import deepcopy
+from functools import lru_cache
 
 from tackle.parser.context import prep_context
 from tackle.utils.files import load, dump
+from tackle.utils.reader import SafeLoader
 
 from tackle.exceptions import InvalidModeException
 from pathlib import Path
@@ -45,10 +48,17 @@ def _output_record(context: 'Context', mode: 'Mode', settings: 'Settings'):
             )
 
 
+@lru_cache(maxsize=32)
+def _load_rerun(rerun_path, mtime):
+    # The mtime is only part of the key so a rewritten file is reloaded
+    with open(rerun_path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
 def _evaluate_rerun(rerun_path, mode: 'Mode'):
     if os.path.exists(rerun_path):
-        with open(rerun_path, 'r') as f:
-            return yaml.safe_load(f)
+        # Copied as the cached object is shared between calls
+        return deepcopy(_load_rerun(rerun_path, os.path.getmtime(rerun_path)))
     # else:
     #     if not mode.record:
     #         print('No rerun file, will create record and use next time.')
@@ -117,7 +127,13 @@ def update_context(
     logger.debug('context_file is %s', context_file_path)
 
     # Main entrypoint to parse the input.
-    prep_context(context=context, mode=mode, source=source, settings=settings)
+    prep_context(
+        context=context,
+        mode=mode,
+        source=source,
+        settings=settings,
+        context_file_path=context_file_path,
+    )
 
     if mode.record:
         _output_record(context=context, mode=mode, settings=settings)
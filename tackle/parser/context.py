@@ -98,11 +98,17 @@ def parse_context(context: 'Context', mode: 'Mode', source: 'Source'):
 
 # TODO: Break this function up
 def prep_context(
-    context: 'Context', mode: 'Mode', source: 'Source', settings: 'Settings'
+    context: 'Context',
+    mode: 'Mode',
+    source: 'Source',
+    settings: 'Settings',
+    context_file_path: str = None,
 ):
     """Prepare the context by setting some default values."""
     # Read config
-    obj = read_config_file(os.path.join(source.repo_dir, source.context_file))
+    if context_file_path is None:
+        context_file_path = os.path.join(source.repo_dir, source.context_file)
+    obj = read_config_file(context_file_path)
 
     # Add the Python object to the context dictionary
     if not context.context_key:
@@ -5,7 +5,13 @@ import os
 import pytest
 from tackle.main import tackle
 from tackle.utils import timeout, TimeoutError
-from google.auth.exceptions import DefaultCredentialsError
+
+google_auth_exceptions = pytest.importorskip('google.auth.exceptions')
+
+if os.name == 'nt':
+    # https://github.com/geometry-labs/tackle-box/runs/2592830572?check_suite_focus=true#step:5:217
+    # https://stackoverflow.com/questions/52779920/why-is-signal-sigalrm-not-working-in-python-on-windows
+    pytest.skip("Skipping GCP tests on windows.", allow_module_level=True)
 
 
 @timeout(3)
@@ -16,22 +22,24 @@ def run_provider_gcp_regions():
     )
 
 
-try:
-    if os.name == 'nt':
-        # https://github.com/geometry-labs/tackle-box/runs/2592830572?check_suite_focus=true#step:5:217
-        # https://stackoverflow.com/questions/52779920/why-is-signal-sigalrm-not-working-in-python-on-windows
-        pytest.skip("Skipping GCP tests on windows.", allow_module_level=True)
-    run_provider_gcp_regions()
-except (TypeError, AttributeError, TimeoutError, DefaultCredentialsError):
-    # TODO: Validate that this is the right skip test
-    pytest.skip("Skipping GCP tests.", allow_module_level=True)
+@pytest.fixture(scope='module', autouse=True)
+def gcp_regions():
+    """Run the regions probe once per module, skipping when GCP is unavailable."""
+    try:
+        return run_provider_gcp_regions()
+    except (
+        TypeError,
+        AttributeError,
+        TimeoutError,
+        google_auth_exceptions.DefaultCredentialsError,
+    ):
+        # TODO: Validate that this is the right skip test
+        pytest.skip("Skipping GCP tests.")
 
 
-def test_provider_gcp_zones(change_dir):
+def test_provider_gcp_zones(change_dir, gcp_regions):
     """Verify gcp zones."""
-    context = run_provider_gcp_regions()
-
-    assert len(context['azs']) > 1
+    assert len(gcp_regions['azs']) > 1
 
 
 def test_provider_gcp_azs_region(change_dir):
@@ -5,10 +5,12 @@
 import os
 from tackle.main import tackle
 
+HERE = os.path.dirname(os.path.abspath(__file__))
+
 
 def test_provider_select(monkeypatch):
     """Verify the hook call works successfully."""
-    monkeypatch.chdir(os.path.abspath(os.path.dirname(__file__)))
+    monkeypatch.chdir(HERE)
 
     # TODO: Need to properly test this with pty. Tests don't cover now
     output = tackle('.', context_file='dict_ok.yaml', no_input=True)
@@ -6,16 +6,19 @@ from __future__ import print_function
 
 import sys
 
-# import re
+import re
 import logging
 import subprocess
 import errno
 import struct
+import shlex
 import shutil
 import os
 import click
+from functools import lru_cache
 from itertools import chain
 from select import select
+from typing import List, Union
 
 from tackle.models import BaseHook
 from tackle.exceptions import HookCallException
@@ -29,6 +32,14 @@ if os.name != 'nt':
 
 logger = logging.getLogger(__name__)
 
+# Anything that needs a shell to be interpreted
+SHELL_METACHARACTERS = re.compile(r'[|&;<>()$`\\"\'*?\[\]#~=%!{}\n]')
+
+
+@lru_cache(maxsize=None)
+def _which(cmd, path):
+    return shutil.which(cmd, path=path)
+
 
 class CommandHook(BaseHook):
     """
@@ -37,20 +48,48 @@ class CommandHook(BaseHook):
     Hides streaming output. To view streaming output of command use the `shell`
     hook.
 
-    :param command: The command to run on the host
+    :param command: The command to run on the host. A list of commands is run in
+        a single shell, chained with `&&`.
     :return: String output of command
     """
 
     type: str = 'command'
 
-    command: str
+    command: Union[str, List[str]]
     ignore_error: bool = False
 
+    def _args(self, command):
+        """Split the command into args if it can be run without a shell."""
+        if SHELL_METACHARACTERS.search(command):
+            return None
+        args = shlex.split(command)
+        if not args:
+            return None
+        # Paths resolve against the cwd which the PATH cache doesn't key on
+        if os.sep in args[0] or (os.altsep and os.altsep in args[0]):
+            return None
+        if _which(args[0], os.environ.get('PATH')):
+            return args
+        return None
+
     def execute(self):
-        p = subprocess.Popen(
-            self.command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        output, err = p.communicate()
+        command = self.command
+        if isinstance(command, list):
+            command = ' && '.join(command)
+
+        args = self._args(command)
+        p = None
+        if args:
+            try:
+                p = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            except OSError:
+                # Stale or no longer executable lookup, let the shell report the error as before
+                pass
+        if p is None:
+            p = subprocess.run(
+                command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        output, err = p.stdout, p.stderr
 
         if err and not self.ignore_error:
             raise HookCallException(err.decode('utf-8'))
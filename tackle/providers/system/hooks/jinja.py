@@ -5,14 +5,13 @@ from __future__ import unicode_literals
 from __future__ import print_function
 
 from jinja2.exceptions import UndefinedError
-from jinja2 import FileSystemLoader
-
 import logging
+import os
 from typing import Dict, Union
 
 from tackle.models import BaseHook
 from tackle.exceptions import UndefinedVariableInTemplate
-from tackle.render.environment import StrictEnvironment
+from tackle.render.environment import get_env
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +34,10 @@ class JinjaHook(BaseHook):
     extra_context: Dict = {}
 
     def execute(self):
-        env = StrictEnvironment(context=self.input_dict)
-        env.loader = FileSystemLoader(self.file_system_loader)
+        env = get_env(
+            context=self.input_dict,
+            template_dir=os.path.abspath(self.file_system_loader),
+        )
         template = env.get_template(self.template_path)
 
         jinja_context = dict(self.output_dict)
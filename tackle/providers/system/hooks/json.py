@@ -33,7 +33,7 @@ class JsonHook(BaseHook):
     def execute(self):
         if self.contents:
             with open(self.path, 'w') as f:
-                json.dump(self.contents, f)
+                f.write(json.dumps(self.contents, separators=(',', ':')))
             return self.path
 
         else:
@@ -34,18 +34,18 @@ class ListdirHook(BaseHook):
 
     def execute(self):
         if isinstance(self.path, str):
-            files = os.listdir(os.path.expanduser(self.path))
-            if self.sort:
-                files.sort()
-            if self.ignore_hidden_files:
-                return [f for f in files if not f.startswith('.')]
-            else:
-                return files
+            return self._listdir(self.path)
 
         if isinstance(self.path, list):
-            contents = {}
-            for i in self.path:
-                contents[i] = os.listdir(os.path.expanduser(i))
-                if self.sort:
-                    contents[i].sort()
-            return contents
+            return {i: self._listdir(i) for i in self.path}
+
+    def _listdir(self, path):
+        with os.scandir(os.path.expanduser(path)) as entries:
+            files = [
+                e.name
+                for e in entries
+                if not (self.ignore_hidden_files and e.name.startswith('.'))
+            ]
+        if self.sort:
+            files.sort()
+        return files
@@ -53,3 +53,51 @@ def test_provider_system_hook_command_exit_ignore(change_dir):
     """Verify the hook call works properly."""
     o = tackle(context_file='command-exit-ignore.yaml', no_input=True)
     assert o
+
+
+def test_provider_system_hook_command_list(change_dir):
+    """Verify a list of commands is chained and run in one call."""
+    context = tackle(context_file='command-list.yaml', no_input=True)
+    assert context['cmd'] == 'stuff\nthings\n'
+
+
+def test_provider_system_hook_command_relative_path_cwd(monkeypatch, tmp_path):
+    """Verify a relative command is resolved against the current cwd each call."""
+    from tackle.providers.system.hooks.command import CommandHook
+
+    with_script = tmp_path / 'with_script'
+    with_script.mkdir()
+    script = with_script / 's.sh'
+    script.write_text('#!/bin/sh\necho stuff\n')
+    script.chmod(0o755)
+    without_script = tmp_path / 'without_script'
+    without_script.mkdir()
+
+    monkeypatch.chdir(with_script)
+    assert CommandHook(command='./s.sh').execute() == 'stuff\n'
+
+    monkeypatch.chdir(without_script)
+    with pytest.raises(HookCallException):
+        CommandHook(command='./s.sh').execute()
+
+
+def _raise(error):
+    raise error()
+
+
+@pytest.mark.parametrize('error', [FileNotFoundError, PermissionError])
+def test_provider_system_hook_command_stale_which(mocker, error):
+    """Verify a command that can't be executed falls back to the shell's error."""
+    from tackle.providers.system.hooks import command
+
+    mocker.patch.object(command, '_which', return_value='/not/a/command')
+    run = command.subprocess.run
+    mocker.patch.object(
+        command.subprocess,
+        'run',
+        side_effect=lambda *args, **kwargs: (
+            run(*args, **kwargs) if kwargs.get('shell') else _raise(error)
+        ),
+    )
+    with pytest.raises(HookCallException):
+        command.CommandHook(command='not-a-command-xyz').execute()
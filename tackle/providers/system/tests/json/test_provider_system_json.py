@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+"""Tests dict input objects for `tackle.providers.system.hooks.json` module."""
+import os
+import pytest
+
+from tackle.main import tackle
+
+
+@pytest.fixture()
+def clean_outputs():
+    """Remove the written json file."""
+    yield
+    if os.path.exists('output.json'):
+        os.remove('output.json')
+
+
+def test_provider_system_hook_json(change_dir, clean_outputs):
+    """Verify the hook writes and then reads back json."""
+    output = tackle(no_input=True)
+
+    assert output['write'] == 'output.json'
+    assert output['read'] == {'stuff': 'things', 'foo': ['bar', 'baz']}
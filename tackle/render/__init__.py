@@ -3,7 +3,7 @@ import ast
 import re
 import six
 
-from tackle.render.environment import StrictEnvironment
+from tackle.render.environment import compile_template, get_env
 from tackle.render.special_vars import get_vars
 from typing import TYPE_CHECKING, Any
 
@@ -59,8 +59,8 @@ def render_variable(context: 'Context', raw: Any):
     elif not isinstance(raw, six.string_types):
         raw = str(raw)
 
-    env = StrictEnvironment(context=context.input_dict)
-    template = env.from_string(raw)
+    env = get_env(context=context.input_dict)
+    template = compile_template(env, raw)
 
     # Build both the {{ cookiecutter.var }} and {{ var }} contexts
     render_context = build_render_context(context)
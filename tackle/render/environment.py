@@ -1,6 +1,7 @@
 """Jinja2 environment and extensions loading."""
+from functools import lru_cache
 
-from jinja2 import Environment, StrictUndefined
+from jinja2 import Environment, FileSystemLoader, StrictUndefined
 
 from tackle.exceptions import UnknownExtension
 
@@ -36,7 +37,8 @@ class ExtensionLoaderMixin(object):
         except ImportError as err:
             raise UnknownExtension('Unable to load extension: {}'.format(err))
 
-    def _read_extensions(self, context):
+    @staticmethod
+    def _read_extensions(context):
         """Return list of extensions as str to be passed on to the Jinja2 env.
 
         If context does not contain the relevant info, return an empty
@@ -63,3 +65,44 @@ class StrictEnvironment(ExtensionLoaderMixin, Environment):
         Also loading extensions defined in cookiecutter.json's _extensions key.
         """
         super(StrictEnvironment, self).__init__(undefined=StrictUndefined, **kwargs)
+
+
+def get_env(context=None, template_dir=None, keep_trailing_newline=False, **envvars):
+    """Return a StrictEnvironment shared by all calls with the same settings.
+
+    Reusing the environment keeps Jinja's internal template cache warm across
+    files and across runs. Extensions are read from the context up front as they
+    are part of what makes two environments interchangeable.
+
+    :param context: Context to read the `_extensions` key from.
+    :param template_dir: Directory to load templates from, should be absolute.
+    :param keep_trailing_newline: Passed on to the Jinja2 Environment.
+    :param envvars: Extra Jinja2 Environment options, ie `_jinja2_env_vars`.
+    """
+    extensions = tuple(ExtensionLoaderMixin._read_extensions(context))
+    return _get_env(
+        extensions, template_dir, keep_trailing_newline, tuple(sorted(envvars.items()))
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_env(extensions, template_dir, keep_trailing_newline, envvars):
+    env = StrictEnvironment(
+        context={'cookiecutter': {'_extensions': list(extensions)}},
+        keep_trailing_newline=keep_trailing_newline,
+        **dict(envvars),
+    )
+    if template_dir:
+        env.loader = FileSystemLoader(template_dir)
+    return env
+
+
+@lru_cache(maxsize=1024)
+def compile_template(env, source):
+    """Compile a short template string, memoized per environment and source.
+
+    Path fragments like `{{cookiecutter.repo_name}}` recur for every file and
+    directory in a template so only compile each one once. Whole file contents
+    are compiled once per run anyway and should not be kept alive here.
+    """
+    return env.from_string(source)
@@ -0,0 +1,38 @@
+"""Binary file detection utils."""
+import codecs
+
+from binaryornot.helpers import is_binary_string
+
+# Only the head of the file is inspected, same as `content_inspector`.
+CHUNK_SIZE = 8192
+
+TEXT_BOMS = (
+    codecs.BOM_UTF32_BE,
+    codecs.BOM_UTF32_LE,
+    codecs.BOM_UTF8,
+    codecs.BOM_UTF16_BE,
+    codecs.BOM_UTF16_LE,
+)
+
+
+def is_binary_chunk(chunk: bytes) -> bool:
+    """Check whether the starting chunk of a file is binary.
+
+    A byte order mark means text and a NUL byte means binary. Chunks that are
+    valid UTF-8 are text. Anything else is ambiguous and falls back to
+    `binaryornot` which applies its encoding heuristics.
+
+    :param chunk: Bytes from the start of the file, at most `CHUNK_SIZE`.
+    """
+    if chunk.startswith(TEXT_BOMS):
+        return False
+    if b'\x00' in chunk:
+        return True
+
+    try:
+        # Non-final decode so a multi-byte char split at the cut is not an error
+        codecs.getincrementaldecoder('utf-8')().decode(chunk, final=False)
+    except UnicodeDecodeError:
+        # Same sized chunk as `binaryornot.check.is_binary` reads
+        return is_binary_string(chunk[:1024])
+    return False
@@ -40,6 +40,68 @@ def rmtree(path):
         shutil.rmtree(path, onerror=force_delete)
 
 
+def _copy_fds(infd, outfd):
+    """Copy between two open file descriptors without going through userspace."""
+    size = os.fstat(infd).st_size
+    blocksize = min(max(size, 2 ** 23), 2 ** 30)
+
+    if hasattr(os, 'copy_file_range'):
+        try:
+            # Can reflink instead of copying on filesystems like btrfs / xfs
+            copied = os.copy_file_range(infd, outfd, blocksize)
+            # Some filesystems return 0 without copying anything so an empty
+            # first call is only trusted for an empty file
+            if copied or not size:
+                while copied:
+                    copied = os.copy_file_range(infd, outfd, blocksize)
+                return
+        except OSError:
+            # ie cross device on older kernels
+            pass
+        # Start over with sendfile
+        os.lseek(infd, 0, os.SEEK_SET)
+        os.lseek(outfd, 0, os.SEEK_SET)
+        os.ftruncate(outfd, 0)
+
+    offset = 0
+    while True:
+        sent = os.sendfile(outfd, infd, offset, blocksize)
+        if sent == 0:
+            if offset == 0 and size:
+                raise OSError('sendfile copied nothing from a non empty file')
+            break
+        offset += sent
+
+
+def fast_copyfile(src, dst):
+    """Copy the contents of `src` to `dst`, in the kernel where possible.
+
+    Tries `os.copy_file_range` then `os.sendfile` and falls back on
+    `shutil.copyfile` where neither is available or supported.
+
+    :param src: The file to copy.
+    :param dst: The path to copy to.
+    """
+    if hasattr(os, 'copy_file_range') or hasattr(os, 'sendfile'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                _copy_fds(fsrc.fileno(), fdst.fileno())
+            return dst
+        except OSError:
+            logger.debug('Falling back on shutil to copy %s', src)
+    return shutil.copyfile(src, dst)
+
+
+def fast_copy2(src, dst):
+    """Copy a file with `fast_copyfile` along with its metadata like `copy2`.
+
+    Meant to be used as the `copy_function` of `shutil.copytree`.
+    """
+    fast_copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
 def make_sure_path_exists(path):
     """Ensure that a directory exists.
 
@@ -9,6 +9,12 @@ import hcl
 import yaml
 import logging
 
+try:
+    # libyaml backed loader, several times faster than the pure python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,7 +38,7 @@ def read_config_file(file, file_extension=None):
             return config
         elif file_extension in ('yaml', 'yml', 'tacklerc'):
             with open(file, encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
             return config
         elif file_extension == 'hcl':
             with open(file) as f:
@@ -3,62 +3,61 @@ import os
 
 import pytest
 
-import tackle.utils.paths
+from tackle import generate
 from tackle.main import tackle
-from tackle.utils.paths import rmtree
+from tackle.models import Context
 
 
-@pytest.fixture
-def remove_test_dir():
-    """Fixture. Remove the folder that is created by the test."""
-    if os.path.exists('test_copy_without_render'):
-        rmtree('test_copy_without_render')
-    yield
-    if os.path.exists('test_copy_without_render'):
-        rmtree('test_copy_without_render')
-
-
-@pytest.mark.usefixtures('clean_system', 'remove_test_dir')
-def test_generate_copy_without_render_extensions(change_dir):
+@pytest.mark.usefixtures('clean_system')
+def test_generate_copy_without_render_extensions(change_dir, tmp_path):
     """Verify correct work of `_copy_without_render` context option.
 
     Some fixtures/files/directories should be rendered during invocation,
     some just copied, without any modification.
     """
-    tackle('test-generate-copy-without-render', no_input=True)
+    tackle('test-generate-copy-without-render', no_input=True, output_dir=str(tmp_path))
+    out = tmp_path / 'test_copy_without_render'
 
-    dir_contents = os.listdir('test_copy_without_render')
+    dir_contents = os.listdir(out)
 
     assert 'test_copy_without_render-not-rendered' in dir_contents
     assert 'test_copy_without_render-rendered' in dir_contents
 
-    with open('test_copy_without_render/README.txt') as f:
-        assert '{{cookiecutter.render_test}}' in f.read()
-
-    with open('test_copy_without_render/README.rst') as f:
-        assert 'I have been rendered!' in f.read()
-
-    with open(
-        'test_copy_without_render/test_copy_without_render-rendered/README.txt'
-    ) as f:
-        assert '{{cookiecutter.render_test}}' in f.read()
-
-    with open(
-        'test_copy_without_render/test_copy_without_render-rendered/README.rst'
-    ) as f:
-        assert 'I have been rendered' in f.read()
-
-    with open(
-        'test_copy_without_render/'
-        'test_copy_without_render-not-rendered/'
-        'README.rst'
-    ) as f:
-        assert '{{cookiecutter.render_test}}' in f.read()
-
-    with open('test_copy_without_render/rendered/not_rendered.yml') as f:
-        assert '{{cookiecutter.render_test}}' in f.read()
-
-    with open(
-        'test_copy_without_render/' 'test_copy_without_render-rendered/' 'README.md'
-    ) as f:
-        assert '{{cookiecutter.render_test}}' in f.read()
+    rendered = out / 'test_copy_without_render-rendered'
+    not_rendered = out / 'test_copy_without_render-not-rendered'
+
+    assert b'{{cookiecutter.render_test}}' in (out / 'README.txt').read_bytes()
+    assert b'I have been rendered!' in (out / 'README.rst').read_bytes()
+    assert b'{{cookiecutter.render_test}}' in (rendered / 'README.txt').read_bytes()
+    assert b'I have been rendered' in (rendered / 'README.rst').read_bytes()
+    assert b'{{cookiecutter.render_test}}' in (not_rendered / 'README.rst').read_bytes()
+    assert (
+        b'{{cookiecutter.render_test}}'
+        in (out / 'rendered' / 'not_rendered.yml').read_bytes()
+    )
+    assert b'{{cookiecutter.render_test}}' in (rendered / 'README.md').read_bytes()
+
+
+@pytest.mark.parametrize(
+    'path,expected',
+    [
+        ('foo/README.txt', True),
+        ('foo/bar/README.rst', False),
+        ('foo/skip-dir', True),
+        ('skip-dir', False),
+    ],
+)
+def test_is_copy_only_path(path, expected):
+    """Verify compiled `_copy_without_render` patterns match like fnmatch."""
+    c = Context(
+        context_key='cookiecutter',
+        input_dict={'cookiecutter': {'_copy_without_render': ['*.txt', 'foo/skip-*']}},
+    )
+    copy_patterns = generate._compile_copy_patterns(c)
+    assert generate.is_copy_only_path(path, copy_patterns) is expected
+
+
+def test_compile_copy_patterns_missing_key():
+    """Verify no patterns are compiled without `_copy_without_render`."""
+    c = Context(context_key='cookiecutter', input_dict={'cookiecutter': {}})
+    assert generate._compile_copy_patterns(c) == []
@@ -208,3 +208,23 @@ def test_generate_file_does_not_translate_crlf_newlines_to_lf(
         simple_text = f.readline()
     assert simple_text == 'newline is CRLF\r\n'
     assert f.newlines == '\r\n'
+
+
+@pytest.mark.parametrize(
+    'path,envvars,expected',
+    [
+        ('files/cheese.txt', {}, 'files/cheese.txt'),
+        ('files/{{ food }}.txt', {}, 'files/cheese.txt'),
+        ('files/{% if food %}yes{% endif %}.txt', {}, 'files/yes.txt'),
+        (
+            'files/{{ food }}.txt',
+            {'variable_start_string': '[['},
+            'files/{{ food }}.txt',
+        ),
+        ('files/[[ food }}.txt', {'variable_start_string': '[['}, 'files/cheese.txt'),
+    ],
+)
+def test_render_path(path, envvars, expected):
+    """Verify paths are only rendered when they contain the env's jinja markers."""
+    env = StrictEnvironment(keep_trailing_newline=True, **envvars)
+    assert generate._render_path(env, path, {'food': 'cheese'}) == expected
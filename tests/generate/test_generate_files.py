@@ -16,6 +16,8 @@ from tackle.main import tackle
 from tackle.models import Source, Context, Output
 from _collections import OrderedDict
 
+HERE = os.path.dirname(os.path.abspath(__file__))
+
 
 @pytest.mark.parametrize('invalid_dirname', ['', '{foo}', '{{foo', 'bar}}'])
 def test_ensure_dir_is_templated_raises(invalid_dirname):
@@ -211,7 +213,7 @@ def test_generate_files_absolute_path(change_dir, tmp_path):
 
 def test_generate_files_output_dir(monkeypatch, tmp_path):
     """Verify `output_dir` option for `generate_files` changing location correctly."""
-    monkeypatch.chdir(os.path.join(os.path.abspath(os.path.dirname(__file__))))
+    monkeypatch.chdir(HERE)
 
     output_dir = Path(tmp_path, 'custom_output_dir')
     output_dir.mkdir()
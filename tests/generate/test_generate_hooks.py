@@ -1,6 +1,7 @@
 """Test work of python and shell hooks for generated projects."""
 import errno
 import os
+import re
 import sys
 
 import pytest
@@ -8,34 +9,16 @@ import pytest
 from _collections import OrderedDict
 
 from tackle.models import Context, Source, Output
-import tackle.utils.paths
 from tackle import generate
 from tackle.exceptions import FailedHookException
 
 WINDOWS = sys.platform.startswith('win')
 
 
-def _delete_dirs(tmpdir):
-    directories_to_delete = [
-        'test-pyhooks/inputpyhooks',
-        'inputpyhooks',
-        'inputhooks',
-        os.path.join(str(tmpdir), 'test-shellhooks'),
-        'test-hooks',
-    ]
-    for directory in directories_to_delete:
-        if os.path.exists(directory):
-            tackle.utils.paths.rmtree(directory)
-    if os.path.exists('shell_post.txt'):
-        os.remove('shell_post.txt')
-
-
-@pytest.fixture(scope='function')
-def remove_additional_folders(tmpdir, change_dir_main_fixtures):
-    """Remove some special folders which are created by the tests."""
-    _delete_dirs(tmpdir)
-    yield
-    _delete_dirs(tmpdir)
+def _dir_names(path):
+    """Return the names in a directory from a single scandir."""
+    with os.scandir(path) as it:
+        return {entry.name for entry in it}
 
 
 def generate_files_wrapper(
@@ -64,19 +47,19 @@ def generate_files_wrapper(
     return output
 
 
-@pytest.mark.usefixtures('clean_system', 'remove_additional_folders')
-def test_ignore_hooks_dirs(change_dir_main_fixtures):
+@pytest.mark.usefixtures('clean_system')
+def test_ignore_hooks_dirs(change_dir_main_fixtures, tmp_path):
     """Verify hooks directory not created in target location on files generation."""
     generate_files_wrapper(
         context={'cookiecutter': {'pyhooks': 'pyhooks'}},
         repo_dir='test-pyhooks/',
-        output_dir='test-pyhooks/',
+        output_dir=tmp_path,
     )
-    assert not os.path.exists('test-pyhooks/inputpyhooks/hooks')
+    assert not os.path.exists(tmp_path / 'inputpyhooks' / 'hooks')
 
 
-@pytest.mark.usefixtures('clean_system', 'remove_additional_folders')
-def test_run_python_hooks(change_dir_main_fixtures):
+@pytest.mark.usefixtures('clean_system')
+def test_run_python_hooks(change_dir_main_fixtures, tmp_path):
     """Verify pre and post generation python hooks executed and result in output_dir.
 
     Each hook should create in target directory. Test verifies that these files
@@ -85,30 +68,32 @@ def test_run_python_hooks(change_dir_main_fixtures):
     generate_files_wrapper(
         context={'cookiecutter': {'pyhooks': 'pyhooks'}},
         repo_dir='test-pyhooks/',
-        output_dir='test-pyhooks/',
+        output_dir=tmp_path,
+    )
+    assert {'python_pre.txt', 'python_post.txt'} <= _dir_names(
+        tmp_path / 'inputpyhooks'
     )
-    assert os.path.exists('test-pyhooks/inputpyhooks/python_pre.txt')
-    assert os.path.exists('test-pyhooks/inputpyhooks/python_post.txt')
 
 
-@pytest.mark.usefixtures('clean_system', 'remove_additional_folders')
-def test_run_python_hooks_cwd():
+@pytest.mark.usefixtures('clean_system')
+def test_run_python_hooks_cwd(change_dir_main_fixtures, monkeypatch, tmp_path):
     """Verify pre and post generation python hooks executed and result in current dir.
 
     Each hook should create in target directory. Test verifies that these files
     created.
     """
+    repo_dir = os.path.abspath('test-pyhooks/')
+    monkeypatch.chdir(tmp_path)
     generate_files_wrapper(
         context={'cookiecutter': {'pyhooks': 'pyhooks'}},
-        repo_dir='test-pyhooks/',
+        repo_dir=repo_dir,
     )
-    assert os.path.exists('inputpyhooks/python_pre.txt')
-    assert os.path.exists('inputpyhooks/python_post.txt')
+    assert {'python_pre.txt', 'python_post.txt'} <= _dir_names('inputpyhooks')
 
 
 @pytest.mark.skipif(WINDOWS, reason='OSError.errno=8 is not thrown on Windows')
-@pytest.mark.usefixtures('clean_system', 'remove_additional_folders')
-def test_empty_hooks():
+@pytest.mark.usefixtures('clean_system')
+def test_empty_hooks(change_dir_main_fixtures, tmp_path):
     """Verify error is raised on empty hook script. Ignored on windows.
 
     OSError.errno=8 is not thrown on Windows when the script is empty
@@ -118,97 +103,119 @@ def test_empty_hooks():
         generate_files_wrapper(
             context={'cookiecutter': {'shellhooks': 'shellhooks'}},
             repo_dir='test-shellhooks-empty/',
+            output_dir=tmp_path,
             overwrite_if_exists=True,
         )
     assert 'shebang' in str(excinfo.value)
 
 
-@pytest.mark.usefixtures('clean_system', 'remove_additional_folders')
-def test_oserror_hooks(mocker):
+@pytest.fixture
+def popen_mock(mocker):
+    """Fixture. Mock subprocess.Popen so that hook scripts are never run."""
+    return mocker.patch('subprocess.Popen')
+
+
+def _os_error(errno_code, message):
+    err = OSError(message)
+    err.errno = errno_code
+    return err
+
+
+@pytest.mark.parametrize(
+    'errno_code,message',
+    [(errno.ENOMEM, 'Out of memory'), (errno.EACCES, 'Permission denied')],
+)
+@pytest.mark.usefixtures('clean_system')
+def test_oserror_hooks(
+    change_dir_main_fixtures, popen_mock, tmp_path, errno_code, message
+):
     """Verify script error passed correctly to cookiecutter error.
 
     Here subprocess.Popen function mocked, ie we do not call hook script,
     just produce expected error.
     """
-    message = 'Out of memory'
-
-    err = OSError(message)
-    err.errno = errno.ENOMEM
-
-    prompt = mocker.patch('subprocess.Popen')
-    prompt.side_effect = err
+    popen_mock.side_effect = _os_error(errno_code, message)
 
     with pytest.raises(FailedHookException) as excinfo:
         generate_files_wrapper(
             context={'cookiecutter': {'shellhooks': 'shellhooks'}},
             repo_dir='test-shellhooks-empty/',
+            output_dir=tmp_path,
             overwrite_if_exists=True,
         )
     assert message in str(excinfo.value)
 
 
-@pytest.mark.usefixtures('clean_system', 'remove_additional_folders')
-def test_run_failing_hook_removes_output_directory():
-    """Verify project directory not created or removed if hook failed."""
-    repo_path = os.path.abspath('test-hooks/')
-    hooks_path = os.path.abspath('test-hooks/hooks')
-
+@pytest.fixture(scope='session')
+def failing_hook_template(tmp_path_factory):
+    """Fixture. Template with a pre gen hook that fails, built once per session."""
+    repo_path = str(tmp_path_factory.mktemp('test-hooks'))
     hook_dir = os.path.join(repo_path, 'hooks')
     template = os.path.join(repo_path, 'input{{cookiecutter.hooks}}')
-    os.mkdir(repo_path)
-    os.mkdir(hook_dir)
-    os.mkdir(template)
+    os.makedirs(hook_dir, exist_ok=True)
+    os.makedirs(template, exist_ok=True)
 
-    hook_path = os.path.join(hooks_path, 'pre_gen_project.py')
+    hook_path = os.path.join(hook_dir, 'pre_gen_project.py')
 
     with open(hook_path, 'w') as f:
         f.write("#!/usr/bin/env python\n")
         f.write("import sys; sys.exit(1)\n")
 
+    return repo_path
+
+
+@pytest.mark.parametrize(
+    'output_dir_existed', [False, True], ids=['new-output-dir', 'existing-output-dir']
+)
+@pytest.mark.usefixtures('clean_system')
+def test_run_failing_hook(failing_hook_template, tmp_path, output_dir_existed):
+    """Verify project directory removed if hook failed, unless it existed before."""
+    if output_dir_existed:
+        os.mkdir(tmp_path / 'inputhooks')
     with pytest.raises(FailedHookException) as excinfo:
         generate_files_wrapper(
             context={'cookiecutter': {'hooks': 'hooks'}},
-            repo_dir='test-hooks/',
+            repo_dir=failing_hook_template,
+            output_dir=tmp_path,
             overwrite_if_exists=True,
         )
 
     assert 'Hook script failed' in str(excinfo.value)
-    assert not os.path.exists('inputhooks')
-
+    assert os.path.exists(tmp_path / 'inputhooks') is output_dir_existed
 
-@pytest.mark.usefixtures('clean_system', 'remove_additional_folders')
-def test_run_failing_hook_preserves_existing_output_directory():
-    """Verify project directory not removed if exist before hook failed."""
-    repo_path = os.path.abspath('test-hooks/')
-    hooks_path = os.path.abspath('test-hooks/hooks')
 
-    hook_dir = os.path.join(repo_path, 'hooks')
-    template = os.path.join(repo_path, 'input{{cookiecutter.hooks}}')
-    os.mkdir(repo_path)
-    os.mkdir(hook_dir)
-    os.mkdir(template)
+@pytest.mark.usefixtures('clean_system')
+def test_run_shell_hooks(change_dir_main_fixtures, mocker, tmp_path):
+    """Verify pre and post generate project shell hooks are invoked.
 
-    hook_path = os.path.join(hooks_path, 'pre_gen_project.py')
+    Here subprocess.Popen is mocked to touch the file each hook script would,
+    the real scripts are run in `test_run_shell_hooks_subprocess`.
+    """
 
-    with open(hook_path, 'w') as f:
-        f.write("#!/usr/bin/env python\n")
-        f.write("import sys; sys.exit(1)\n")
+    def _fake_popen(script_command, shell=False, cwd='.'):
+        with open(script_command[-1]) as f:
+            marker = re.search(r"touch '(.+)'", f.read()).group(1)
+        open(os.path.join(cwd, marker), 'w').close()
+        return mocker.MagicMock(**{'wait.return_value': 0})
 
-    os.mkdir('inputhooks')
-    with pytest.raises(FailedHookException) as excinfo:
-        generate_files_wrapper(
-            context={'cookiecutter': {'hooks': 'hooks'}},
-            repo_dir='test-hooks/',
-            overwrite_if_exists=True,
-        )
+    # Only the hooks module's subprocess, `platform` shells out for special vars
+    subprocess = mocker.patch('tackle.hooks.subprocess')
+    subprocess.Popen.side_effect = _fake_popen
 
-    assert 'Hook script failed' in str(excinfo.value)
-    assert os.path.exists('inputhooks')
+    generate_files_wrapper(
+        context={'cookiecutter': {'shellhooks': 'shellhooks'}},
+        repo_dir='test-shellhooks/',
+        output_dir=tmp_path,
+    )
+    assert {'shell_pre.txt', 'shell_post.txt'} <= _dir_names(
+        tmp_path / 'inputshellhooks'
+    )
 
 
+@pytest.mark.slow
 @pytest.mark.skipif(sys.platform.startswith('win'), reason="Linux only test")
-@pytest.mark.usefixtures('clean_system', 'remove_additional_folders')
-def test_run_shell_hooks(tmpdir):
+@pytest.mark.usefixtures('clean_system')
+def test_run_shell_hooks_subprocess(change_dir_main_fixtures, tmp_path):
     """Verify pre and post generate project shell hooks executed.
 
     This test for .sh files.
@@ -216,21 +223,16 @@ def test_run_shell_hooks(tmpdir):
     generate_files_wrapper(
         context={'cookiecutter': {'shellhooks': 'shellhooks'}},
         repo_dir='test-shellhooks/',
-        output_dir=os.path.join(str(tmpdir), 'test-shellhooks'),
-    )
-    shell_pre_file = os.path.join(
-        str(tmpdir), 'test-shellhooks', 'inputshellhooks', 'shell_pre.txt'
+        output_dir=os.path.join(str(tmp_path), 'test-shellhooks'),
     )
-    shell_post_file = os.path.join(
-        str(tmpdir), 'test-shellhooks', 'inputshellhooks', 'shell_post.txt'
+    assert {'shell_pre.txt', 'shell_post.txt'} <= _dir_names(
+        tmp_path / 'test-shellhooks' / 'inputshellhooks'
     )
-    assert os.path.exists(shell_pre_file)
-    assert os.path.exists(shell_post_file)
 
 
 @pytest.mark.skipif(not sys.platform.startswith('win'), reason="Win only test")
-@pytest.mark.usefixtures('clean_system', 'remove_additional_folders')
-def test_run_shell_hooks_win(tmpdir):
+@pytest.mark.usefixtures('clean_system')
+def test_run_shell_hooks_win(change_dir_main_fixtures, tmp_path):
     """Verify pre and post generate project shell hooks executed.
 
     This test for .bat files.
@@ -238,30 +240,22 @@ def test_run_shell_hooks_win(tmpdir):
     generate_files_wrapper(
         context={'cookiecutter': {'shellhooks': 'shellhooks'}},
         repo_dir='test-shellhooks-win/',
-        output_dir=os.path.join(str(tmpdir), 'test-shellhooks-win'),
+        output_dir=os.path.join(str(tmp_path), 'test-shellhooks-win'),
     )
-    shell_pre_file = os.path.join(
-        str(tmpdir), 'test-shellhooks-win', 'inputshellhooks', 'shell_pre.txt'
+    assert {'shell_pre.txt', 'shell_post.txt'} <= _dir_names(
+        tmp_path / 'test-shellhooks-win' / 'inputshellhooks'
     )
-    shell_post_file = os.path.join(
-        str(tmpdir), 'test-shellhooks-win', 'inputshellhooks', 'shell_post.txt'
-    )
-    assert os.path.exists(shell_pre_file)
-    assert os.path.exists(shell_post_file)
 
 
-@pytest.mark.usefixtures("clean_system", "remove_additional_folders")
-def test_ignore_shell_hooks(tmp_path):
+@pytest.mark.usefixtures("clean_system")
+def test_ignore_shell_hooks(change_dir_main_fixtures, tmp_path):
     """Verify *.txt files not created, when accept_hooks=False."""
     generate_files_wrapper(
         context={"cookiecutter": {"shellhooks": "shellhooks"}},
         repo_dir="test-shellhooks/",
-        output_dir=tmp_path.joinpath('test-shellhooks'),
+        output_dir=tmp_path / "test-shellhooks",
         accept_hooks=False,
     )
-    shell_pre_file = tmp_path.joinpath("test-shellhooks/inputshellhooks/shell_pre.txt")
-    shell_post_file = tmp_path.joinpath(
-        "test-shellhooks/inputshellhooks/shell_post.txt"
-    )
-    assert not shell_pre_file.exists()
-    assert not shell_post_file.exists()
+    out = tmp_path / "test-shellhooks" / "inputshellhooks"
+    for name in ("shell_pre.txt", "shell_post.txt"):
+        assert not (out / name).exists()
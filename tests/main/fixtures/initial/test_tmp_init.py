@@ -4,10 +4,12 @@
 import os
 from tackle.main import tackle
 
+HERE = os.path.dirname(os.path.abspath(__file__))
+
 
 def test_tmp_init(monkeypatch, tmpdir):
     """Verify the hook call works successfully."""
-    monkeypatch.chdir(os.path.abspath(os.path.dirname(__file__)))
+    monkeypatch.chdir(HERE)
 
     o = tackle('.', no_input=True, output_dir=str(tmpdir))
 
@@ -11,11 +11,13 @@ import pytest
 import tackle.utils.paths
 from tackle import main
 
+HERE = os.path.dirname(os.path.abspath(__file__))
+
 
 @pytest.fixture(scope='function')
 def remove_additional_dirs(monkeypatch, request):
     """Fixture. Remove special directories which are created during the tests."""
-    monkeypatch.chdir(os.path.abspath(os.path.dirname(__file__)))
+    monkeypatch.chdir(HERE)
 
     def fin_remove_additional_dirs():
         if os.path.isdir('fake-project'):
@@ -86,3 +86,23 @@ def test_parser_hooks_raises_error_on_bad_hook_input_type(change_curdir_fixtures
 #
 #     assert len(left_over_operators) == 0
 #     assert len(operator_types) == len(set(operator_types))
+
+
+def test_parser_hooks_post_gen_hook_chdir(tmp_path, monkeypatch):
+    """Verify post gen hooks run after parsing and respect `chdir`."""
+    sub_dir = tmp_path / 'sub'
+    sub_dir.mkdir()
+    (tmp_path / 'tackle.yaml').write_text(
+        'post:\n'
+        '  type: yaml\n'
+        '  path: post.yaml\n'
+        '  contents:\n'
+        '    stuff: things\n'
+        f'  chdir: {sub_dir}\n'
+        '  post_gen_hook: true\n'
+    )
+    monkeypatch.chdir(tmp_path)
+
+    tackle('.', no_input=True)
+
+    assert (sub_dir / 'post.yaml').exists()
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 
 """Tests dict input objects for `cookiecutter.operator.lists` module."""
-import oyaml as yaml
+import yaml
 from tackle.main import tackle
+from tackle.utils.reader import SafeLoader
 import pytest
 import os
+from pathlib import Path
 
 
 @pytest.fixture()
@@ -26,8 +28,7 @@ def test_parser_record_bool_input(change_dir, clean_output):
         record=True,
     )
 
-    with open(clean_output) as f:
-        record_output = yaml.load(f)
+    record_output = yaml.load(Path(clean_output).read_bytes(), Loader=SafeLoader)
 
     assert 'stuff' in o
     assert 'stuff' in record_output
@@ -42,8 +43,7 @@ def test_parser_record_str_input(change_dir, clean_output):
         record=clean_output,
     )
 
-    with open(clean_output) as f:
-        record_output = yaml.load(f)
+    record_output = yaml.load(Path(clean_output).read_bytes(), Loader=SafeLoader)
 
     assert 'stuff' in o2
     assert 'stuff' in record_output
@@ -59,8 +59,7 @@ def test_parser_record_str_input(change_dir, clean_output):
 #         record=True,
 #     )
 #
-#     with open(clean_output) as f:
-#         record_output = yaml.load(f)
+#     record_output = yaml.load(Path(clean_output).read_bytes(), Loader=SafeLoader)
 #
 #     assert 'stuff' in o2
 #     assert 'stuff' in record_output
@@ -80,8 +79,7 @@ def test_parser_record_str_input_and_different_input(change_dir):
 
     out_file = "tackle-other.record.yaml"
 
-    with open(out_file) as f:
-        record_output = yaml.load(f)
+    record_output = yaml.load(Path(out_file).read_bytes(), Loader=SafeLoader)
 
     assert 'stuff' in o1
     assert 'stuff' in record_output
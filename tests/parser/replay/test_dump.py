@@ -5,6 +5,8 @@ from tackle.utils import files
 
 import pytest
 
+HERE = os.path.dirname(os.path.abspath(__file__))
+
 
 @pytest.fixture
 def template_name():
@@ -15,7 +17,7 @@ def template_name():
 @pytest.fixture
 def replay_file(monkeypatch, replay_test_dir, template_name):
     """Fixture to return a actual file name of the dump."""
-    monkeypatch.chdir(os.path.join(os.path.abspath(os.path.dirname(__file__)), '..'))
+    monkeypatch.chdir(os.path.join(HERE, '..'))
 
     file_name = '{}.json'.format(template_name)
     return os.path.join(replay_test_dir, file_name)
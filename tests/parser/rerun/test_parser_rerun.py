@@ -42,3 +42,18 @@ def test_parser_rerun_broken_recover(change_dir, clean_rerun):
         rerun = yaml.load(f)
 
     assert rerun['foo'] == 'bar'
+
+
+def test_parser_evaluate_rerun_reloads_changed_file(tmp_path):
+    """Verify the cached rerun file is copied and reloaded once rewritten."""
+    from tackle.parser import _evaluate_rerun
+
+    rerun_path = tmp_path / RERUN_FILE
+    rerun_path.write_text('foo: bar\n')
+    rerun = _evaluate_rerun(str(rerun_path), None)
+    rerun['foo'] = 'baz'
+    assert _evaluate_rerun(str(rerun_path), None) == {'foo': 'bar'}
+
+    rerun_path.write_text('foo: bin\n')
+    os.utime(rerun_path, (0, 0))
+    assert _evaluate_rerun(str(rerun_path), None) == {'foo': 'bin'}
@@ -1,7 +1,7 @@
 """Collection of tests around loading extensions."""
 import pytest
 
-from tackle.render.environment import StrictEnvironment
+from tackle.render.environment import StrictEnvironment, compile_template, get_env
 from tackle.exceptions import UnknownExtension
 from tackle.main import tackle
 import os
@@ -35,3 +35,24 @@ def test_env_should_evaluate_is_defined(change_dir_main_fixtures):
     assert 'not_defined' not in o
     assert 'not_defined_again' not in o
     assert 'defined_again' in o
+
+
+def test_get_env_is_reused():
+    """Verify `get_env` returns the same environment for the same settings."""
+    context = {'cookiecutter': {'_extensions': []}}
+    env = get_env(context=context, keep_trailing_newline=True)
+
+    assert get_env(context=context, keep_trailing_newline=True) is env
+    assert get_env(context=context, keep_trailing_newline=False) is not env
+    assert get_env(keep_trailing_newline=True, trim_blocks=True) is not env
+    assert get_env(keep_trailing_newline=True, trim_blocks=True).trim_blocks
+
+
+def test_compile_template_is_reused():
+    """Verify `compile_template` only compiles each source once per environment."""
+    env = get_env()
+    template = compile_template(env, '{{ foo }}')
+
+    assert compile_template(env, '{{ foo }}') is template
+    assert compile_template(get_env(trim_blocks=True), '{{ foo }}') is not template
+    assert template.render(foo='bar') == 'bar'
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+import tackle.utils.binary
 import tackle.utils.context_manager
 import tackle.utils.paths
 import tackle.utils.reader
@@ -243,3 +244,63 @@ def test_valid_read_config_file(valid_config_file, change_dir_main_fixtures):
     """Validate generic reader works properly."""
     output = tackle.utils.reader.read_config_file(valid_config_file)
     assert output == {'project_slug': 'best_eva', 'stuff': 'things'}
+
+
+@pytest.mark.parametrize(
+    'contents,expected',
+    [
+        (b'plain text\n', False),
+        (b'\xef\xbb\xbftext with a bom', False),
+        (b'\xff\xfet\x00e\x00x\x00t\x00', False),
+        ('café ☃\n'.encode('utf-8'), False),
+        (b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR', True),
+        (b'', False),
+    ],
+)
+def test_is_binary_chunk(contents, expected):
+    """Verify `utils.binary.is_binary_chunk` detects text and binary contents."""
+    assert tackle.utils.binary.is_binary_chunk(contents) is expected
+
+
+def test_fast_copyfile(tmp_path):
+    """Verify `utils.paths.fast_copyfile` copies the whole file over."""
+    src = Path(tmp_path, 'src')
+    dst = Path(tmp_path, 'dst')
+    contents = bytes(range(256)) * 4096
+    src.write_bytes(contents)
+    dst.write_bytes(b'previous contents that are longer than nothing')
+
+    tackle.utils.paths.fast_copyfile(str(src), str(dst))
+
+    assert dst.read_bytes() == contents
+
+
+def test_fast_copyfile_falls_back_to_sendfile(tmp_path, mocker):
+    """Verify `utils.paths.fast_copyfile` recovers when copy_file_range fails."""
+    mocker.patch('os.copy_file_range', side_effect=OSError, create=True)
+    src = Path(tmp_path, 'src')
+    dst = Path(tmp_path, 'dst')
+    src.write_text('stuff')
+
+    tackle.utils.paths.fast_copyfile(str(src), str(dst))
+
+    assert dst.read_text() == 'stuff'
+
+
+@pytest.mark.parametrize('sendfile_copies', [True, False])
+def test_fast_copyfile_copy_file_range_copies_nothing(
+    tmp_path, mocker, sendfile_copies
+):
+    """Verify `utils.paths.fast_copyfile` doesn't trust an empty first copy."""
+    mocker.patch('os.copy_file_range', return_value=0, create=True)
+    if not sendfile_copies:
+        mocker.patch('os.sendfile', return_value=0)
+        # So the shutil fallback doesn't go through the mocked sendfile as well
+        mocker.patch('shutil._USE_CP_SENDFILE', False, create=True)
+    src = Path(tmp_path, 'src')
+    dst = Path(tmp_path, 'dst')
+    src.write_text('stuff')
+
+    tackle.utils.paths.fast_copyfile(str(src), str(dst))
+
+    assert dst.read_text() == 'stuff'